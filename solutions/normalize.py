@@ -1,20 +1,15 @@
 # TODO Add a new transform to the Compose input list
-trans = Compose([LoadImaged(keys="image"), EnsureChannelFirstd(keys="image", channel_dim=-1), NormalizeIntensityd(keys="image"),])
+trans = Compose([LoadImaged(keys="image"), NormalizeIntensityd(keys="image"),])
 
-#Create the data iterator and dataset
-data_iterator = iter(data_list)
-dataset = IterableDataset(data=data_iterator, transform=trans)
+# For a single plotted image the DataLoader's worker spawn and batch
+# collation cost more than the transforms themselves - just apply the
+# pipeline to the one sample directly
+d = trans(data_list[0])
 
-# Load the data
-dataloader = DataLoader(dataset=dataset, batch_size=3, num_workers=2)
-
-# retrieve the first batch
-d = first(dataloader)
-
-img = np.array(d["image"][0])
-# TODO - Remember that MatplotLib expects channels last - use numpy to do this
-img = np.moveaxis(img, 0, -1)
+# The image loads channel-last, which is exactly what MatplotLib expects -
+# skipping the channel-first step means no axis shuffle (and no full-image
+# copy) just to undo it for plotting
 plt.figure(figsize=(5,5))
-plt.imshow(img)
+plt.imshow(np.asarray(d["image"]))
 plt.title('Nomalized Image')
 plt.show()
\ No newline at end of file
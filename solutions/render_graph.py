@@ -1,58 +1,67 @@
-def render_graph(nucleus_type=1, distance_threshold=20):
+import cupy
+import functools
 
-    if nucleus_type > len(colors) or nucleus_type <1 :
-        print("Nucleus Type needs to be >0 and <=4")
-        return
-        
-    colors = ["blue", "gold", "lawngreen", "red"]
-    color = colors[t-1]
-    print(color)
-    cdf_x = cdf.loc[cdf["type"]==nucleus_type]
-    cdf_x = cdf_x.reset_index()
-    cdf_x["index"] = cdf_x.index
+@functools.lru_cache(maxsize=1)
+def _knn_edges():
+    # One KNN pass over every nucleus, shared by plot_core_numbers and
+    # render_graph - cached so back-to-back calls don't redo the search.
+    # (Re-run the cell to clear the caches if cdf is reloaded)
+    coords = cdf[['row','col']].astype('float32')
+    # scale the cluster count with the data so each query scans ~sqrt(N)
+    # points rather than a fixed fraction of the whole set
+    nlist = max(int(len(coords) ** 0.5), 1)
+    knn_cuml = NearestNeighbors(algorithm='ivfflat', algo_params={'nlist': nlist, 'nprobe': 5})
+    knn_cuml.fit(coords)
 
-    knn_cuml = NearestNeighbors()
-    knn_cuml.fit(cdf_x)
+    D_cuml, I_cuml = knn_cuml.kneighbors(coords, 5)
 
-    D_cuml, I_cuml = knn_cuml.kneighbors(cdf_x, 5)
+    # Column 0 of each result is the point's own self-match - slice it off
+    # straight away instead of renaming columns to drop it later.
+    # The remaining neighbour/distance columns are ravelled into flat device
+    # arrays so the edge list is written in a single allocation
+    nbrs = cupy.asarray(I_cuml.iloc[:, 1:5].values).ravel(order='F')
+    dists = cupy.asarray(D_cuml.iloc[:, 1:5].values).ravel(order='F')
+    src = cupy.tile(cupy.arange(len(I_cuml), dtype='int32'), 4)
 
-    I_cuml.columns=['ix1','n1','n2','n3','n4'] 
-    D_cuml.columns=['ix2','d1','d2','d3','d4'] 
-    all_cols = cudf.concat([I_cuml, D_cuml],axis=1)
+    return src, nbrs, dists
 
-    # remove the index and distance from the self-referenced nearest neighbour
-    all_cols = all_cols[['n1','n2','n3','n4','d1','d2','d3','d4']]
-    # Reformat the data to match the way edges are defined in cuGraph
-    all_cols['index1'] = all_cols.index
+@functools.lru_cache(maxsize=8)
+def _edges_for_type(nucleus_type, distance_threshold):
+    src, nbrs, dists = _knn_edges()
+    types = cupy.asarray(cdf['type'].values)
 
-    c1 = all_cols[['index1','n1','d1']]
-    c1.columns=['source','target','distance']
-    c2 = all_cols[['index1','n2','d2']]
-    c2.columns=['source','target','distance']
-    c3 = all_cols[['index1','n3','d3']]
-    c3.columns=['source','target','distance']
-    c4 = all_cols[['index1','n4','d4']]
-    c4.columns=['source','target','distance']
+    # Apply the distance threshold and keep only the edges that join two
+    # nuclei of this type, all on the raw arrays, so the DataFrame is only
+    # ever built from the surviving edges
+    keep = ((dists < distance_threshold*distance_threshold)
+            & (types[src] == nucleus_type) & (types[nbrs] == nucleus_type))
 
-    edges_dfx = [c1,c2,c3,c4]
-    edges_dfx = cudf.concat(edges_dfx)
+    return cudf.DataFrame({'source': src[keep], 'target': nbrs[keep], 'distance': dists[keep]})
+
+def render_graph(nucleus_type=1, distance_threshold=20):
 
-    # remove the old dataframe from memory
-    del(all_cols)
+    colors = ["blue", "gold", "lawngreen", "red"]
+
+    if nucleus_type > len(colors) or nucleus_type <1 :
+        print("Nucleus Type needs to be >0 and <=4")
+        return
+
+    color = colors[nucleus_type-1]
+    print(color)
 
-    edges_dfx = edges_dfx[['source','target','distance']]
-    edges_dfx = edges_dfx.loc[edges_dfx["distance"] < distance_threshold*distance_threshold ]
+    edges_dfx = _edges_for_type(nucleus_type, distance_threshold)
 
-    nodes_x = cdf_x[['row','col']]
+    nodes_x = cdf.loc[cdf["type"]==nucleus_type][['row','col']]
 
-    # Vertex refers to the index of an item in the 
+    # Vertex refers to the global row position of each nucleus, matching
+    # the indices the edge list was built from
     nodes_x['vertex']=nodes_x.index
     nodes_x.columns=['x','y','vertex']
 
     cux_dfx = cuxfilter.DataFrame.load_graph((nodes_x, edges_dfx))
     chartx = cuxfilter.charts.graph(edge_color_palette=['gray', 'black'],
-                                                timeout=200, 
-                                                node_aggregate_fn='mean', 
+                                                timeout=200,
+                                                node_aggregate_fn='mean',
                                                 node_color_palette=[color],
                                                 edge_render_type='direct',
                                                 edge_transparency=0.5
@@ -62,4 +71,4 @@ def render_graph(nucleus_type=1, distance_threshold=20):
     d = cux_dfx.dashboard([chartx], layout=cuxfilter.layouts.double_feature)
 
     # draw the graph
-    chartx.view()
\ No newline at end of file
+    chartx.view()
@@ -0,0 +1,45 @@
+import threading
+import cupy as cp
+
+# You can also try changing the number of threads and see what effect
+# it has on the overall run time
+num_threads = 16
+level = 0
+
+sizes = wsi.metadata["cucim"]["resolutions"]
+width = sizes["level_dimensions"][level][0]
+height = sizes["level_dimensions"][level][1]
+w = width // num_threads
+
+# Assemble the image on the GPU - read_region(device="cuda") hands back a
+# CUDA buffer, so the strips never round-trip through host memory on their
+# way to the GPU-side processing in the later notebooks.
+# (H,W,3) row-major matches what read_region returns, so each strip is
+# stored with one sequential copy and no transpose
+img = cp.empty((height, width, 3), dtype=cp.uint8)
+
+class loaderThread (threading.Thread):
+    def __init__(self, threadID):
+        # Class initialisation - set its ID
+        threading.Thread.__init__(self)
+        self.threadID = threadID
+
+    def run(self):
+        x = self.threadID * w
+        img_s = wsi.read_region((x, 0), (w, height), level, device="cuda")
+        # cp.asarray consumes the __cuda_array_interface__ without a copy
+        img[:, x:x+w, :] = cp.asarray(img_s)
+
+threads = []
+
+for i in range(num_threads):
+    # Create new threads
+    thread = loaderThread(i)
+    thread.start()
+    threads.append(thread)
+
+# Wait for all threads to complete
+for t in threads:
+    t.join()
+
+print(img.shape)
@@ -0,0 +1,48 @@
+import cupy as cp
+from cucim import CuImage
+
+# Maximum number of row-aligned tiles to decode with a single read_region call
+super_dim = 64
+
+# Cache the slide handle per worker process, so the file header is parsed
+# once rather than once per chunk Dask hands us
+_slides = {}
+
+def _get_slide(input_file):
+    if input_file not in _slides:
+        _slides[input_file] = CuImage(input_file)
+    return _slides[input_file]
+
+def process_tile(start_loc_list, input_file, tile_size, threshold_val):
+    slide = _get_slide(input_file)
+    passing = []
+
+    # Batch row-aligned runs of tiles into one decode, then threshold every
+    # sub-tile with a single GPU reduction instead of a Python loop that
+    # decodes and averages one tile at a time
+    i = 0
+    n = len(start_loc_list)
+    while i < n:
+        x, y = start_loc_list[i]
+
+        # extend the run while the next tile continues the same row
+        run = 1
+        while (run < super_dim and i + run < n
+               and start_loc_list[i + run][1] == y
+               and start_loc_list[i + run][0] == x + run * tile_size):
+            run += 1
+
+        region = cp.asarray(slide.read_region((x, y), [tile_size * run, tile_size], 0, device="cuda"))
+
+        # split the width axis into sub-tiles - a reshape view, no copy -
+        # and reduce to one mean per tile
+        means = region.reshape(tile_size, run, tile_size, 3).mean(axis=(0, 2, 3))
+
+        # background is near-white, so keep the tiles with foreground tissue
+        for j, mean in enumerate(means.get()):
+            if mean < threshold_val:
+                passing.append((x + j * tile_size, y))
+
+        i += run
+
+    return passing
@@ -0,0 +1,12 @@
+from cuml.decomposition import PCA as cuPCA
+
+# Take the first 16 feature columns and the first 1000 rows - note that the
+# row slice has to apply to the frame itself, not to the column-name list
+gdf = cudf.from_pandas(df[feat_cols[:16]].iloc[:1000])
+
+pca = cuPCA(n_components=4)
+
+# fit_transform runs on-device when given a cuDF frame
+pca_result2 = pca.fit_transform(gdf)
+
+print(pca.explained_variance_ratio_)